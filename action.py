@@ -1,10 +1,13 @@
 """Base action class for filtering and executing operations on Reddit submissions."""
 
+import logging
 from collections.abc import Callable, Iterable
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from praw.models import Submission
 
+logger = logging.getLogger(__name__)
+
 
 class Action:
     """
@@ -52,7 +55,7 @@ class Action:
 
         """
         self.name = name
-        self.subreddits = set(subreddits) if subreddits is not None else None
+        self.subreddits = frozenset(subreddit.lower() for subreddit in subreddits) if subreddits is not None else None
         self.max_age_days = max_age_days
         self.min_age_days = min_age_days
         self.is_self_post = is_self_post
@@ -60,8 +63,26 @@ class Action:
         self.dry_run = dry_run
         self.delete_after_execution = delete_after_execution
         self.action = action
+        self._subreddit_checked_externally = False
+        self.prepare()
+
+    def prepare(self) -> None:
+        """
+        Precompute the age cutoffs for a run.
 
-    def _should_execute(self, submission: Submission) -> bool:
+        Called once by ActionExecutor.execute before iterating submissions,
+        so that the age filters reduce to a float comparison against a POSIX
+        timestamp instead of constructing datetimes per submission.
+        """
+        now = datetime.now(timezone.utc)
+        self._max_age_cutoff = None
+        self._min_age_cutoff = None
+        if self.max_age_days is not None:
+            self._max_age_cutoff = (now - timedelta(days=self.max_age_days)).timestamp()
+        if self.min_age_days is not None:
+            self._min_age_cutoff = (now - timedelta(days=self.min_age_days)).timestamp()
+
+    def _should_execute(self, submission: Submission, meta: tuple | None = None) -> bool:
         """
         Check if the action should be executed on the given submission.
 
@@ -70,29 +91,39 @@ class Action:
 
         Args:
             submission: The Reddit submission to evaluate.
+            meta: Optional precomputed (subreddit name, created_utc, is_self,
+                url) tuple, so that attributes fetched once by the caller are
+                not re-read per action. If None, the attributes are read from
+                the submission.
 
         Returns:
             True if all filters pass and the action should execute,
             False otherwise.
 
         """
-        if self.subreddits is not None and submission.subreddit.display_name.lower() not in self.subreddits:
-            return False
-        if self.max_age_days is not None and submission.created_utc < datetime.now() - timedelta(
-            days=self.max_age_days
+        if meta is None:
+            subreddit_name = getattr(submission, "_cached_sub_name", None)
+            if subreddit_name is None:
+                subreddit_name = submission.subreddit.display_name.lower()
+            meta = (subreddit_name, submission.created_utc, submission.is_self, submission.url)
+        subreddit_name, created_utc, is_self, url = meta
+        if (
+            self.subreddits is not None
+            and not self._subreddit_checked_externally
+            and subreddit_name not in self.subreddits
         ):
             return False
-        if self.min_age_days is not None and submission.created_utc > datetime.now() - timedelta(
-            days=self.min_age_days
-        ):
+        if self._max_age_cutoff is not None and created_utc < self._max_age_cutoff:
+            return False
+        if self._min_age_cutoff is not None and created_utc > self._min_age_cutoff:
             return False
-        if self.is_self_post is not None and submission.is_self != self.is_self_post:
+        if self.is_self_post is not None and is_self != self.is_self_post:
             return False
-        if self.has_url is not None and (submission.url is None or submission.url == ""):  # noqa: SIM103
+        if self.has_url is not None and (url is None or url == ""):  # noqa: SIM103
             return False
         return True
 
-    def execute(self, submission: Submission) -> bool:
+    def execute(self, submission: Submission, *, meta: tuple | None = None) -> bool:
         """
         Execute the action on a submission if it passes all filters.
 
@@ -101,16 +132,18 @@ class Action:
 
         Args:
             submission: The Reddit submission to process.
+            meta: Optional precomputed attribute tuple forwarded to
+                ``_should_execute``.
 
         Returns:
             Boolean indicating whether the action was executed successfully,
             or None/False if execution was skipped or failed.
 
         """
-        if not self._should_execute(submission):
+        if not self._should_execute(submission, meta):
             return False
         if self.dry_run:
-            print(f"Would execute action {self.name} on submission: {submission.title}")
+            logger.info("Would execute action %s on submission %s", self.name, submission.id)
             return False
         result = self.action(submission)
         if result is not None:
@@ -1,11 +1,17 @@
 """Executor for applying actions to saved Reddit submissions."""
 
-import os
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import praw
 from praw.models import Submission
 
 from action import Action
+from reddit import get_reddit_client
+
+logger = logging.getLogger(__name__)
+
+MAX_WORKERS = 8
+DELETE_WORKERS = 4
 
 
 class ActionExecutor:
@@ -37,16 +43,57 @@ class ActionExecutor:
 
         """
         self.actions = actions
-        self.submissions_to_delete = {}
+        self._actions_by_subreddit: dict[str, list[Action]] = {"*": []}
+        for action in actions:
+            if action.subreddits is None:
+                self._actions_by_subreddit["*"].append(action)
+                continue
+            for subreddit in action.subreddits:
+                self._actions_by_subreddit.setdefault(subreddit, []).append(action)
+            action._subreddit_checked_externally = True
+        self.submissions_to_delete: list[Submission] = []
         self.max_submissions = max_submissions
         self.dry_run = dry_run
-        self.reddit = praw.Reddit(
-            client_id=os.environ["REDDIT_CLIENT_ID"],
-            client_secret=os.environ["REDDIT_CLIENT_SECRET"],
-            user_agent=os.environ["REDDIT_USER_AGENT"],
-            username=os.environ["REDDIT_USERNAME"],
-            password=os.environ["REDDIT_PASSWORD"],
-        )
+        self.reddit = get_reddit_client()
+
+    def _collect_pending(self) -> list[tuple[Submission, Action]]:
+        """
+        Gather the (submission, action) pairs that pass their filters.
+
+        Iterates the saved listing, reading each submission's attributes once,
+        and matches it against the actions bucketed for its subreddit. Dry-run
+        actions are logged and skipped here.
+
+        Returns:
+            List of (submission, action) pairs ready to be executed.
+
+        """
+        # The saved listing is returned newest-first, so if every action has a
+        # max-age cutoff we can stop iterating (and stop PRAW from fetching
+        # further pages) at the first submission older than all of them.
+        global_max_cutoff = None
+        if self.actions and all(action._max_age_cutoff is not None for action in self.actions):
+            global_max_cutoff = min(action._max_age_cutoff for action in self.actions)
+
+        saved = self.reddit.user.me().saved(limit=self.max_submissions, params={"type": "links", "raw_json": 1})
+        pending: list[tuple[Submission, Action]] = []
+        for submission in saved:
+            if getattr(submission, "is_self", None) is None:
+                continue
+            if global_max_cutoff is not None and submission.created_utc < global_max_cutoff:
+                break
+            subreddit_name = submission.subreddit_name_prefixed.removeprefix("r/").lower()
+            submission._cached_sub_name = subreddit_name
+            meta = (subreddit_name, submission.created_utc, submission.is_self, submission.url)
+            candidates = self._actions_by_subreddit.get(subreddit_name, []) + self._actions_by_subreddit["*"]
+            for action in candidates:
+                if not action._should_execute(submission, meta):
+                    continue
+                if action.dry_run:
+                    logger.info("Would execute action %s on submission %s", action.name, submission.id)
+                    continue
+                pending.append((submission, action))
+        return pending
 
     def execute(self) -> None:
         """
@@ -56,17 +103,26 @@ class ActionExecutor:
         and deletes submissions that were marked for deletion after successful
         execution (unless in dry-run mode).
         """
-        saved = self.reddit.user.me().saved(limit=self.max_submissions)
-        for submission in saved:
-            if not isinstance(submission, Submission):
-                continue
-            for action in self.actions:
-                did_execute = action.execute(submission)
-                if did_execute and action.delete_after_execution:
-                    self.submissions_to_delete[submission.id] = submission
+        for action in self.actions:
+            action.prepare()
+
+        pending = self._collect_pending()
+
+        seen_ids: set[str] = set()
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(action.action, submission): (submission, action) for submission, action in pending
+            }
+            for future in as_completed(futures):
+                submission, action = futures[future]
+                result = future.result()
+                did_execute = True if result is None else result
+                if did_execute and action.delete_after_execution and submission.id not in seen_ids:
+                    seen_ids.add(submission.id)
+                    self.submissions_to_delete.append(submission)
 
         if self.dry_run:
-            print(f"Would delete {len(self.submissions_to_delete)} submissions")
+            logger.info("Would delete %d submissions", len(self.submissions_to_delete))
             return
-        for submission in self.submissions_to_delete.values():
-            submission.delete()
+        with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+            list(executor.map(lambda submission: submission.delete(), self.submissions_to_delete))
@@ -1,14 +1,43 @@
 """Action implementation for saving Reddit submission URLs to Instapaper."""
 
-import base64
+import logging
 import os
+import re
 from collections.abc import Iterable
-from urllib.parse import urlparse
+from urllib.parse import urlencode
 
 import requests
 from praw.models import Submission
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from action import Action
+from action_executor import MAX_WORKERS
+
+logger = logging.getLogger(__name__)
+
+_API_URL = "https://www.instapaper.com/api/add"
+
+_NETLOC_RE = re.compile(r"^[a-z+.-]+://([^/?#]+)")
+
+_SELECTION_TEMPLATE = 'From %s: "%s"'
+
+_EXCLUDE_DOMAINS = frozenset(
+    {
+        "i.redd.it",
+        "imgur.com",
+        "reddit.com",
+        "v.redd.it",
+        "youtu.be",
+        "youtube.com",
+    }
+)
+
+
+def _is_excluded(netloc: str) -> bool:
+    """Check whether the host or any of its parent domains is excluded."""
+    parts = netloc.split(".")
+    return any(".".join(parts[i:]) in _EXCLUDE_DOMAINS for i in range(len(parts) - 1))
 
 
 class InstapaperAction(Action):
@@ -43,19 +72,20 @@ class InstapaperAction(Action):
             dry_run=dry_run,
         )
 
-        self.basic_auth = f"{os.environ['INSTAPAPER_USER']}:{os.environ['INSTAPAPER_PASS']}"
-        self.basic_auth_encoded = base64.b64encode(self.basic_auth.encode()).decode()
-
-        self.exclude_domains = [
-            "i.redd.it",
-            "imgur.com",
-            "reddit.com",
-            "v.redd.it",
-            "www.reddit.com",
-            "www.youtube.com",
-            "youtu.be",
-            "youtube.com",
-        ]
+        self.session = requests.Session()
+        self.session.auth = (os.environ["INSTAPAPER_USER"], os.environ["INSTAPAPER_PASS"])
+        self.session.headers["User-Agent"] = "reddit-actions"
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=1,
+                # Match the executor's worker count so concurrent saves never
+                # block waiting for a pooled connection.
+                pool_maxsize=MAX_WORKERS,
+                max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]),
+            ),
+        )
+        self._request_template = self.session.prepare_request(requests.Request("GET", _API_URL))
 
     def execute(self, submission: Submission) -> bool:
         """
@@ -72,26 +102,24 @@ class InstapaperAction(Action):
             True if successfully saved to Instapaper, False otherwise.
 
         """
-        parsed_url = urlparse(submission.url)
-        domain = parsed_url.netloc
-        if domain in self.exclude_domains:
+        match = _NETLOC_RE.match(submission.url)
+        domain = match.group(1) if match else ""
+        if _is_excluded(domain):
             return False
-        print(submission.url)
+        logger.debug("Posting %s", submission.url)
 
         try:
-            query_params = {
-                "url": submission.url,
-                "selection": f'From r/{submission.subreddit.display_name}: "{submission.title}"',
-            }
-            response = requests.get(
-                "https://www.instapaper.com/api/add",
-                headers={
-                    "Authorization": f"Basic {self.basic_auth_encoded}",
-                },
-                params=query_params,
+            query = urlencode(
+                {
+                    "url": submission.url,
+                    "selection": _SELECTION_TEMPLATE % (submission.subreddit_name_prefixed, submission.title),
+                }
             )
+            request = self._request_template.copy()
+            request.url = f"{_API_URL}?{query}"
+            response = self.session.send(request, timeout=(3.05, 10))
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
-            print(f"Error adding to Instapaper: {e}")
+            logger.error("Error adding to Instapaper: %s", e)
             return False
         return True
@@ -1,5 +1,7 @@
 """Main entry point for the Reddit actions application."""
 
+import logging
+
 from dotenv import load_dotenv
 
 from action_executor import ActionExecutor
@@ -7,6 +9,8 @@ from instapaper_action import InstapaperAction
 
 load_dotenv()
 
+logging.basicConfig(level=logging.INFO)
+
 
 def main():
     """Initialize actions and execute them on saved Reddit submissions."""
@@ -0,0 +1,26 @@
+"""Shared Reddit client for the application."""
+
+import functools
+import os
+
+import praw
+
+
+@functools.lru_cache(maxsize=1)
+def get_reddit_client() -> praw.Reddit:
+    """
+    Return the process-wide PRAW client.
+
+    The client is created on first use from the environment variables
+    REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, REDDIT_USER_AGENT,
+    REDDIT_USERNAME and REDDIT_PASSWORD, then cached so every caller shares
+    one authenticated client — one OAuth token fetch and one underlying
+    connection pool for the whole process.
+    """
+    return praw.Reddit(
+        client_id=os.environ["REDDIT_CLIENT_ID"],
+        client_secret=os.environ["REDDIT_CLIENT_SECRET"],
+        user_agent=os.environ["REDDIT_USER_AGENT"],
+        username=os.environ["REDDIT_USERNAME"],
+        password=os.environ["REDDIT_PASSWORD"],
+    )